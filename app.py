@@ -1,60 +1,185 @@
 import os
 import io
+import re
+import math
 import base64
+import threading
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 import numpy as np
-from flask import Flask, request, render_template, jsonify
+import xxhash
+import orjson
+import polars as pl
+from flask import Flask, request, render_template
 import matplotlib
 matplotlib.use('Agg')
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import seaborn as sns
+from PIL import Image
 
 app = Flask(__name__)
 
+# Marcadores que pandas interpreta como nulos por defecto; Polars solo reconoce la celda vacía
+VALORES_NULOS_CSV = ['', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan',
+                     '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None',
+                     'n/a', 'nan', 'null']
+# Filas usadas por Polars para inferir los tipos; si una fila posterior no encaja se usa pandas
+FILAS_INFERENCIA_ESQUEMA = 10000
+# Nombre que Polars da a las columnas cuyo encabezado está repetido
+PATRON_ENCABEZADO_DUPLICADO = re.compile(r'_duplicated_\d+$')
+# Línea vacía o solo con espacios entre dos líneas de datos (pandas la omite, Polars no)
+PATRON_LINEA_EN_BLANCO = re.compile(rb'\n[ \t]*\r?\n')
+
+# Número máximo de columnas para las que se anota cada celda del heatmap de correlación
+MAX_COLUMNAS_ANOTADAS = 20
+
+# A partir de este número de filas el heatmap de nulos se agrupa en FILAS_HEATMAP_NULOS bloques
+MAX_FILAS_HEATMAP_NULOS = 2000
+FILAS_HEATMAP_NULOS = 800
+
+# Tamaño máximo de la muestra y número de puntos de la malla para la curva KDE de los histogramas
+MAX_MUESTRA_KDE = 10000
+PUNTOS_KDE = 128
+
+# Proporción máxima de valores únicos/filas para convertir una columna de texto a 'category'
+MAX_PROPORCION_CATEGORICA = 0.5
+
+# Resultados recientes indexados por el hash del contenido del CSV (LRU acotado)
+MAX_ENTRADAS_CACHE = 32
+_cache_resultados = OrderedDict()
+_cache_lock = threading.Lock()
+
 # --- Funciones Genéricas para Generar Gráficas ---
 
+def crear_figura(figsize):
+    """Crea una figura Agg fuera de pyplot, segura para usarse desde varios hilos."""
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    return fig
+
 def fig_to_base64(fig):
     """Convierte una figura de Matplotlib a una cadena base64 para HTML."""
+    # Un solo renderizado Agg (sin bbox_inches='tight', que dibuja dos veces)
+    # codificado como WebP, bastante más ligero que PNG dentro del JSON
+    fig.tight_layout()
+    fig.canvas.draw()
+    img = Image.fromarray(np.asarray(fig.canvas.buffer_rgba())).convert('RGB')
     buf = io.BytesIO()
-    fig.savefig(buf, format='png', bbox_inches='tight')
-    buf.seek(0)
-    img_str = base64.b64encode(buf.read()).decode('utf-8')
-    plt.close(fig)
-    return f"data:image/png;base64,{img_str}"
-
-def generar_heatmap_nulos(df):
-    """Genera un mapa de calor de valores nulos."""
+    img.save(buf, format='WEBP', quality=80, method=4)
+    img_str = base64.b64encode(buf.getvalue()).decode('utf-8')
+    return f"data:image/webp;base64,{img_str}"
+
+def generar_heatmap_nulos(null_mask, columnas):
+    """Genera un mapa de calor de valores nulos a partir de la máscara (ndarray) de nulos."""
     try:
-        if df.isnull().sum().sum() == 0:
+        # Conteo de nulos por columna en una sola reducción de NumPy
+        nulos_por_columna = null_mask.sum(axis=0)
+        if nulos_por_columna.sum() == 0:
             return None # No hay nulos
-        fig, ax = plt.subplots(figsize=(12, 8))
-        sns.heatmap(df.isnull(), cbar=False, cmap='viridis', yticklabels=False, ax=ax)
+        heat = null_mask
+        if null_mask.shape[0] > MAX_FILAS_HEATMAP_NULOS:
+            # Agrupar filas en bloques contiguos y mostrar la fracción de nulos de cada bloque,
+            # para no rasterizar una celda por fila del DataFrame
+            idx = np.linspace(0, null_mask.shape[0], FILAS_HEATMAP_NULOS + 1, dtype=int)
+            heat = np.add.reduceat(null_mask.astype(np.float32), idx[:-1], axis=0) / np.diff(idx)[:, None]
+
+        fig = crear_figura((12, 8))
+        ax = fig.subplots()
+        # Como DataFrame para conservar los nombres y que seaborn aclare las etiquetas ('auto')
+        heat = pd.DataFrame(heat, columns=columnas)
+        sns.heatmap(heat, cbar=False, cmap='viridis', vmin=0, vmax=1, yticklabels=False, ax=ax)
         ax.set_title('Mapa de Calor de Valores Nulos', fontsize=16)
         return fig_to_base64(fig)
     except Exception as e:
         print(f"Error generando heatmap de nulos: {e}")
         return None
 
-def generar_heatmap_correlacion(df):
+def correlacion_pearson(numeric_df, hay_nulos):
+    """Correlación de Pearson por pares completos (como DataFrame.corr) calculada con productos matriciales."""
+    columnas = numeric_df.columns
+
+    # Sin nulos: una sola SGEMM en float32 (la mitad de bytes que float64). El resultado
+    # solo se usa para el heatmap, así que esa precisión basta para visualizar.
+    # Los inf y los valores fuera del rango de float32 se detectan en la covarianza
+    if not hay_nulos:
+        with np.errstate(invalid='ignore', divide='ignore', over='ignore'):
+            arr = numeric_df.to_numpy(dtype=np.float32)
+            media = arr.mean(axis=0, dtype=np.float64)
+            arr = arr - media.astype(np.float32)
+            cov = (arr.T @ arr).astype(np.float64)
+            var = np.diag(cov)
+            # float32 no resuelve columnas con desviación minúscula frente a su media
+            # (ni sumas que desbordan); en ese caso se repite el cálculo en float64
+            std_fila = np.sqrt(var / len(arr))
+            if np.isfinite(cov).all() and not ((var > 0) & (std_fila < 1e-3 * np.abs(media))).any():
+                corr = cov / np.outer(np.sqrt(var), np.sqrt(var))
+                return pd.DataFrame(np.clip(corr, -1.0, 1.0), index=columnas, columns=columnas)
+
+    arr = numeric_df.to_numpy(dtype=np.float64)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        # Centrar por la media de cada columna no altera la correlación y mejora la estabilidad numérica
+        arr = arr - np.nanmean(arr, axis=0)
+        presentes = ~np.isnan(arr)
+
+        if presentes.all():
+            # Una sola GEMM sobre la matriz centrada
+            cov = arr.T @ arr
+            std = np.sqrt(np.diag(cov))
+            corr = cov / np.outer(std, std)
+        else:
+            # Con nulos: cada par usa solo las filas donde ambas columnas tienen valor
+            mask = presentes.astype(np.float64)
+            x = np.where(presentes, arr, 0.0)
+            n = mask.T @ mask
+            suma_x = x.T @ mask          # suma de x_i en las filas válidas para (i, j)
+            suma_x2 = (x * x).T @ mask   # suma de x_i^2 en las filas válidas para (i, j)
+            suma_xy = x.T @ x
+            cov = suma_xy - suma_x * suma_x.T / n
+            var = suma_x2 - suma_x ** 2 / n
+            corr = cov / np.sqrt(var * var.T)
+
+    corr = np.clip(corr, -1.0, 1.0)
+    return pd.DataFrame(corr, index=columnas, columns=columnas)
+
+def generar_heatmap_correlacion(numeric_df, hay_nulos):
     """Genera un mapa de calor de correlación para variables numéricas."""
     try:
-        numeric_df = df.select_dtypes(include=np.number)
         if numeric_df.shape[1] < 2:
             return None # No hay suficientes columnas numéricas para correlación
         
-        corr = numeric_df.corr()
-        fig, ax = plt.subplots(figsize=(12, 10))
-        sns.heatmap(corr, annot=True, fmt=".2f", cmap='coolwarm', ax=ax)
+        corr = correlacion_pearson(numeric_df, hay_nulos)
+        if corr.isna().to_numpy().all():
+            return None # Ningún par de columnas tiene una correlación definida
+        fig = crear_figura((12, 10))
+        ax = fig.subplots()
+        # Con muchas columnas el texto por celda es ilegible y domina el tiempo de renderizado
+        anotar = corr.shape[0] <= MAX_COLUMNAS_ANOTADAS
+        # Todas las etiquetas solo cuando se anota; si no, seaborn las aclara ('auto')
+        etiquetas = list(corr.columns) if anotar else 'auto'
+        sns.heatmap(corr, annot=anotar, fmt=".2f", cmap='coolwarm',
+                    xticklabels=etiquetas, yticklabels=etiquetas, ax=ax)
         ax.set_title('Mapa de Calor de Correlación Numérica', fontsize=16)
         return fig_to_base64(fig)
     except Exception as e:
         print(f"Error generando heatmap de correlación: {e}")
         return None
 
-def generar_histogramas_numericos(df):
+def kde_gaussiana(muestra, xs):
+    """Evalúa una KDE gaussiana (ancho de banda de Scott) en los puntos xs; None si no es posible."""
+    std = muestra.std(ddof=1) if muestra.size > 1 else 0.0
+    if std == 0:
+        return None
+    bw = std * muestra.size ** (-1 / 5)
+    z = (xs[:, None] - muestra[None, :]) / bw
+    return np.exp(-0.5 * z * z).sum(axis=1) / (muestra.size * bw * np.sqrt(2 * np.pi))
+
+def generar_histogramas_numericos(numeric_df):
     """Genera histogramas para las primeras 9 variables numéricas."""
     try:
-        numeric_cols = df.select_dtypes(include=np.number).columns
+        numeric_cols = numeric_df.columns
         if len(numeric_cols) == 0:
             return None
 
@@ -64,30 +189,52 @@ def generar_histogramas_numericos(df):
         n_cols = 3
         n_rows = (n_plots - 1) // n_cols + 1
         
-        fig, axes = plt.subplots(n_rows, n_cols, figsize=(15, 5 * n_rows))
+        fig = crear_figura((15, 5 * n_rows))
+        axes = fig.subplots(n_rows, n_cols)
         axes = axes.flatten() # Aplanar para facilitar la iteración
 
+        rng = np.random.default_rng(0)
         for i, col in enumerate(numeric_cols_to_plot):
-            sns.histplot(df[col], kde=True, ax=axes[i])
+            valores = numeric_df[col].to_numpy(dtype=np.float64)
+            valores = valores[np.isfinite(valores)]
             axes[i].set_title(f'Distribución de {col}', fontsize=12)
+            axes[i].set_xlabel(col)
+            axes[i].set_ylabel('Conteo')
+            if valores.size == 0:
+                continue
+
+            counts, edges = np.histogram(valores, bins='auto')
+            axes[i].stairs(counts, edges, fill=True, alpha=0.5, color='C0')
+            axes[i].stairs(counts, edges, color='C0')
+
+            # Curva KDE sobre una malla fija, estimada con una muestra acotada de la columna
+            muestra = valores
+            if muestra.size > MAX_MUESTRA_KDE:
+                muestra = rng.choice(muestra, MAX_MUESTRA_KDE, replace=False)
+            xs = np.linspace(edges[0], edges[-1], PUNTOS_KDE)
+            densidad = kde_gaussiana(muestra, xs)
+            if densidad is not None:
+                axes[i].plot(xs, densidad * valores.size * (edges[1] - edges[0]), color='C0')
         
         # Ocultar ejes no utilizados
         for i in range(n_plots, len(axes)):
             axes[i].set_visible(False)
             
-        fig.suptitle('Distribución de Variables Numéricas', fontsize=20, y=1.03)
-        fig.tight_layout()
+        fig.suptitle('Distribución de Variables Numéricas', fontsize=20)
         return fig_to_base64(fig)
     except Exception as e:
         print(f"Error generando histogramas: {e}")
         return None
 
-def generar_barras_categoricas(df):
+def generar_barras_categoricas(categorical_df):
     """Genera gráficos de barras para las primeras 6 variables categóricas."""
     try:
-        categorical_cols = df.select_dtypes(include=['object', 'category']).columns
+        if categorical_df.empty:
+            return None # Sin columnas categóricas o sin filas
+
         # Filtrar columnas con demasiadas categorías únicas para que sea legible
-        suitable_cols = [col for col in categorical_cols if df[col].nunique() < 20]
+        n_unicos = categorical_df.nunique()
+        suitable_cols = list(n_unicos.index[n_unicos < 20])
 
         if len(suitable_cols) == 0:
             return None
@@ -98,12 +245,15 @@ def generar_barras_categoricas(df):
         n_cols = 2
         n_rows = (n_plots - 1) // n_cols + 1
 
-        fig, axes = plt.subplots(n_rows, n_cols, figsize=(15, 6 * n_rows))
+        fig = crear_figura((15, 6 * n_rows))
+        axes = fig.subplots(n_rows, n_cols)
         axes = axes.flatten()
 
         for i, col in enumerate(cols_to_plot):
-            order = df[col].value_counts().index[:10] # Top 10 categorías
-            sns.countplot(y=df[col], ax=axes[i], order=order, palette='viridis')
+            vc = categorical_df[col].value_counts().iloc[:10] # Top 10 categorías
+            # Invertido para que la categoría más frecuente quede arriba
+            axes[i].barh(vc.index.astype(str)[::-1], vc.to_numpy()[::-1],
+                         color=sns.color_palette('viridis', len(vc))[::-1])
             axes[i].set_title(f'Frecuencia en {col}', fontsize=12)
             axes[i].set_xlabel('Conteo')
             axes[i].set_ylabel('')
@@ -111,13 +261,186 @@ def generar_barras_categoricas(df):
         for i in range(n_plots, len(axes)):
             axes[i].set_visible(False)
             
-        fig.suptitle('Frecuencia de Variables Categóricas', fontsize=20, y=1.03)
-        fig.tight_layout()
+        fig.suptitle('Frecuencia de Variables Categóricas', fontsize=20)
         return fig_to_base64(fig)
     except Exception as e:
         print(f"Error generando gráficos de barras: {e}")
         return None
 
+def leer_csv_polars(contenido):
+    """Parsea el CSV con Polars y lo ajusta a lo que produciría pd.read_csv; None si no es posible."""
+    # pandas ignora las líneas en blanco. Las finales (habituales en CSV exportados) se
+    # recortan; si hay alguna intermedia se deja el archivo a pandas
+    fin = len(contenido.rstrip(b' \t\r\n'))
+    salto = contenido.find(b'\n', fin)
+    if salto != -1 and salto + 1 < len(contenido):
+        contenido = contenido[:salto + 1]
+    if PATRON_LINEA_EN_BLANCO.search(contenido):
+        return None
+
+    tabla = pl.read_csv(contenido, null_values=VALORES_NULOS_CSV,
+                        infer_schema_length=FILAS_INFERENCIA_ESQUEMA)
+    # Polars renombra los encabezados repetidos como 'x_duplicated_N' en lugar del 'x.N' de pandas
+    if any(PATRON_ENCABEZADO_DUPLICADO.search(col) for col in tabla.columns):
+        return None
+
+    vacias = []
+    for col, dtype in tabla.schema.items():
+        if dtype != pl.String:
+            continue
+        serie = tabla[col]
+        if tabla.height and serie.null_count() == tabla.height:
+            vacias.append(col)  # pandas lee las columnas completamente vacías como float64
+        elif serie.str.contains(r'^\s|\s$').any():
+            # pandas acepta números con espacios alrededor (' 3'); Polars los deja como texto
+            numeros = serie.str.strip_chars().cast(pl.Float64, strict=False)
+            if numeros.null_count() == serie.null_count():
+                return None
+    if vacias:
+        tabla = tabla.with_columns(pl.col(vacias).cast(pl.Float64))
+
+    df = tabla.to_pandas()
+    # Encabezados vacíos: pandas los nombra 'Unnamed: N' según su posición
+    df.columns = [col if col != '' else f'Unnamed: {i}' for i, col in enumerate(df.columns)]
+    return df
+
+def leer_csv(stream):
+    """Lee el CSV con el parser multihilo de Polars; recurre a pandas si falla o si difiere."""
+    try:
+        df = leer_csv_polars(stream.read())
+        if df is not None:
+            return df
+    except (pl.exceptions.PolarsError, ValueError):
+        # ValueError cubre los fallos de conversión a pandas (pyarrow.ArrowInvalid), p. ej.
+        # enteros fuera de int64 que Polars infiere como i128
+        pass
+    # El stream binario se pasa tal cual: pandas decodifica mientras parsea,
+    # sin materializar el archivo completo como str
+    stream.seek(0)
+    return pd.read_csv(stream, encoding='utf-8')
+
+def describir_numericas(numeric_df):
+    """Equivalente a numeric_df.describe() con una sola partición por columna para mínimo, cuartiles y máximo."""
+    arr = numeric_df.to_numpy(dtype=np.float64)
+    stats = np.full((8, arr.shape[1]), np.nan)
+    for j, col in enumerate(arr.T):
+        valores = col[~np.isnan(col)]
+        n = valores.size
+        stats[0, j] = n
+        if n == 0:
+            continue
+        # Columnas con inf: media/std resultan inf/NaN como en pandas, sin avisos por petición
+        with np.errstate(invalid='ignore'):
+            media = valores.mean()
+            stats[1, j] = media
+            if n > 1:
+                desv = valores - media
+                stats[2, j] = np.sqrt(np.dot(desv, desv) / (n - 1))
+
+            # Interpolación lineal entre los órdenes que rodean cada cuantil (como pandas);
+            # en posiciones exactas se toma el valor tal cual para no generar inf * 0
+            posiciones = np.array([0.0, 0.25, 0.5, 0.75, 1.0]) * (n - 1)
+            inferiores = np.floor(posiciones).astype(int)
+            superiores = np.ceil(posiciones).astype(int)
+            ordenados = np.partition(valores, np.unique(np.concatenate([inferiores, superiores])))
+            peso = posiciones - inferiores
+            interpolados = ordenados[inferiores] * (1 - peso) + ordenados[superiores] * peso
+            stats[3:, j] = np.where(peso == 0, ordenados[inferiores], interpolados)
+
+    indice = ['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max']
+    return pd.DataFrame(stats, index=indice, columns=numeric_df.columns)
+
+def formatear_bytes(num, sufijo=''):
+    """Formatea un tamaño en bytes con la unidad más adecuada, como lo hace pandas."""
+    for unidad in ['bytes', 'KB', 'MB', 'GB', 'TB']:
+        if num < 1024.0:
+            return f"{num:3.1f}{sufijo} {unidad}"
+        num /= 1024.0
+    return f"{num:3.1f}{sufijo} PB"
+
+def generar_info_columnas(df, nulos_por_columna):
+    """Construye un resumen equivalente a df.info() a partir de reducciones vectorizadas."""
+    dtypes = list(df.dtypes)
+    nombres_dtypes = [str(d) for d in dtypes]
+    no_nulos = len(df) - nulos_por_columna
+    columnas = [str(c) for c in df.columns]
+
+    # Igual que memory_usage(deep=False) pero sin construir una Series por columna:
+    # los dtypes de NumPy ocupan itemsize * filas; solo las extensiones se consultan
+    memoria = df.index.memory_usage()
+    for j, dtype in enumerate(dtypes):
+        if isinstance(dtype, np.dtype):
+            memoria += dtype.itemsize * len(df)
+        else:
+            memoria += df.iloc[:, j].array.nbytes
+
+    ancho_col = max([len('Column')] + [len(c) for c in columnas])
+    ancho_cnt = max([len('Non-Null Count')] + [len(f"{n} non-null") for n in no_nulos])
+    ancho_idx = max(len(' # '), len(f" {len(columnas) - 1}"))
+    lineas = [
+        f"RangeIndex: {len(df)} entries, 0 to {len(df) - 1}" if len(df) else "RangeIndex: 0 entries",
+        f"Data columns (total {len(columnas)} columns):",
+        f"{' #':<{ancho_idx}}  {'Column':<{ancho_col}}  {'Non-Null Count':<{ancho_cnt}}  Dtype",
+        f"{'---':<{ancho_idx}}  {'------':<{ancho_col}}  {'--------------':<{ancho_cnt}}  -----",
+    ]
+    lineas += [
+        f"{f' {i}':<{ancho_idx}}  {c:<{ancho_col}}  {f'{n} non-null':<{ancho_cnt}}  {d}"
+        for i, (c, n, d) in enumerate(zip(columnas, no_nulos, nombres_dtypes))
+    ]
+    conteo_dtypes = sorted(Counter(nombres_dtypes).items())
+    lineas.append("dtypes: " + ", ".join(f"{d}({n})" for d, n in conteo_dtypes))
+    # Sin deep=True el tamaño de las columnas 'object' es aproximado (por eso el '+')
+    sufijo = '+' if 'object' in nombres_dtypes else ''
+    lineas.append(f"memory usage: {formatear_bytes(memoria, sufijo)}")
+    return "\n".join(lineas)
+
+def hash_contenido(stream, tam_bloque=1 << 20):
+    """Calcula el hash xxh3 del contenido del stream por bloques y lo deja rebobinado."""
+    h = xxhash.xxh3_64()
+    for bloque in iter(lambda: stream.read(tam_bloque), b''):
+        h.update(bloque)
+    stream.seek(0)
+    return h.hexdigest()
+
+def obtener_de_cache(clave):
+    """Devuelve el resultado guardado para la clave (marcándolo como reciente) o None."""
+    with _cache_lock:
+        resultado = _cache_resultados.get(clave)
+        if resultado is not None:
+            _cache_resultados.move_to_end(clave)
+        return resultado
+
+def guardar_en_cache(clave, resultado):
+    """Guarda un resultado y descarta el menos reciente si se supera MAX_ENTRADAS_CACHE."""
+    with _cache_lock:
+        _cache_resultados[clave] = resultado
+        _cache_resultados.move_to_end(clave)
+        while len(_cache_resultados) > MAX_ENTRADAS_CACHE:
+            _cache_resultados.popitem(last=False)
+
+def convertir_a_categoricas(df):
+    """Convierte a dtype 'category' las columnas de texto con baja cardinalidad."""
+    if len(df) == 0:
+        return df
+    texto_df = df.select_dtypes(include=['object', 'string'])
+    n_unicos = texto_df.nunique()
+    # Las columnas con muchos valores distintos (p. ej. identificadores) se dejan como texto
+    for col in n_unicos.index[n_unicos / len(df) < MAX_PROPORCION_CATEGORICA]:
+        df[col] = df[col].astype('category')
+    return df
+
+def tabla_a_json(tabla):
+    """Convierte una tabla a {index, columns, data}; ±inf viajan como texto porque JSON no los admite."""
+    datos = tabla.to_dict(orient='split')
+    # orjson escribiría inf/-inf como null, que el navegador mostraría como NaN
+    datos['data'] = [[str(v) if isinstance(v, float) and math.isinf(v) else v for v in fila]
+                     for fila in datos['data']]
+    return datos
+
+def respuesta_json(payload):
+    """Serializa la respuesta con orjson (C) en lugar del json estándar de jsonify."""
+    return app.response_class(orjson.dumps(payload), mimetype='application/json')
+
 # --- Rutas de la Aplicación Flask ---
 
 @app.route('/')
@@ -129,54 +452,71 @@ def index():
 def upload_file():
     """Recibe el archivo CSV, lo analiza y devuelve los resultados en formato JSON."""
     if 'file' not in request.files:
-        return jsonify({'error': 'No se encontró el archivo'})
+        return respuesta_json({'error': 'No se encontró el archivo'})
     
     file = request.files['file']
     if file.filename == '':
-        return jsonify({'error': 'No se seleccionó ningún archivo'})
+        return respuesta_json({'error': 'No se seleccionó ningún archivo'})
 
     if file and file.filename.endswith('.csv'):
         try:
-            df = pd.read_csv(io.StringIO(file.read().decode('utf-8')))
+            # Un CSV idéntico a uno ya analizado reutiliza el resultado completo
+            clave = hash_contenido(file.stream)
+            resultado = obtener_de_cache(clave)
+            if resultado is not None:
+                return respuesta_json({**resultado, 'nombre_archivo': file.filename})
+
+            df = convertir_a_categoricas(leer_csv(file.stream))
+
+            # Subconjuntos reutilizados en todo el análisis (se calculan una sola vez)
+            numeric_df = df.select_dtypes(include=np.number)
+            categorical_df = df.select_dtypes(include=['object', 'string', 'category'])
+            null_mask = df.isna().to_numpy()
+            nulos_por_columna = null_mask.sum(axis=0, dtype=np.int32)
+            hay_nulos_numericos = bool(nulos_por_columna[df.columns.get_indexer(numeric_df.columns)].any())
 
             # 1. Estadísticas básicas
             num_filas, num_columnas = df.shape
             
             # 2. Información de tipos de datos y nulos (texto)
-            buffer = io.StringIO()
-            df.info(buf=buffer)
-            info_str = buffer.getvalue()
-
-            # 3. Conteo de duplicados
-            num_duplicados = int(df.duplicated().sum())
-
-            # 4. Estadísticas descriptivas (HTML)
-            desc_numericas_html = df.describe(include='number').round(2).to_html(classes='table table-striped table-bordered', border=0)
-            desc_categoricas_html = df.describe(include=['object', 'category']).to_html(classes='table table-striped table-bordered', border=0)
-
-            # 5. Generación de gráficas genéricas
-            graficas = {
-                'null_heatmap': generar_heatmap_nulos(df),
-                'correlation_heatmap': generar_heatmap_correlacion(df),
-                'numeric_distributions': generar_histogramas_numericos(df),
-                'categorical_distributions': generar_barras_categoricas(df)
-            }
+            info_str = generar_info_columnas(df, nulos_por_columna)
+
+            # 3. Conteo de duplicados (hash por fila + una sola reducción en NumPy)
+            hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+            _, counts = np.unique(hashes, return_counts=True)
+            num_duplicados = int((counts - 1).sum())
 
-            return jsonify({
+            # 4. Estadísticas descriptivas (JSON {index, columns, data}; la tabla se construye en el navegador)
+            desc_numericas = tabla_a_json(describir_numericas(numeric_df).round(2)) if not numeric_df.empty else None
+            desc_categoricas = tabla_a_json(categorical_df.describe()) if not categorical_df.empty else None
+
+            # 5. Generación de gráficas genéricas (en paralelo, cada una con su propia figura)
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                futuros = {
+                    'null_heatmap': executor.submit(generar_heatmap_nulos, null_mask, df.columns),
+                    'correlation_heatmap': executor.submit(generar_heatmap_correlacion, numeric_df, hay_nulos_numericos),
+                    'numeric_distributions': executor.submit(generar_histogramas_numericos, numeric_df),
+                    'categorical_distributions': executor.submit(generar_barras_categoricas, categorical_df)
+                }
+                graficas = {clave: futuro.result() for clave, futuro in futuros.items()}
+
+            resultado = {
                 'nombre_archivo': file.filename,
                 'num_filas': num_filas,
                 'num_columnas': num_columnas,
                 'info_columnas': info_str,
                 'num_duplicados': num_duplicados,
-                'desc_numericas': desc_numericas_html if not df.select_dtypes(include='number').empty else "<p>No hay columnas numéricas.</p>",
-                'desc_categoricas': desc_categoricas_html if not df.select_dtypes(include=['object', 'category']).empty else "<p>No hay columnas categóricas.</p>",
+                'desc_numericas': desc_numericas,
+                'desc_categoricas': desc_categoricas,
                 'graficas': graficas
-            })
+            }
+            guardar_en_cache(clave, resultado)
+            return respuesta_json(resultado)
 
         except Exception as e:
-            return jsonify({'error': f'Hubo un error al procesar el archivo: {str(e)}'})
+            return respuesta_json({'error': f'Hubo un error al procesar el archivo: {str(e)}'})
 
-    return jsonify({'error': 'Formato de archivo no válido. Por favor, sube un archivo .csv'})
+    return respuesta_json({'error': 'Formato de archivo no válido. Por favor, sube un archivo .csv'})
 
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5000))
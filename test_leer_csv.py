@@ -0,0 +1,29 @@
+import io
+
+import pandas as pd
+import pytest
+
+from app import leer_csv
+
+# Cada CSV debe leerse igual que con pd.read_csv, tanto por Polars como por el respaldo
+CASOS = {
+    'simple': b'a,b,c\n1,x,2.5\n2,y,3.5\n',
+    'nulos': b'a,b\n1,NA\n,x\n3,null\n',
+    'linea_en_blanco_final': b'a,b\n1,2\n3,4\n\n',
+    'linea_en_blanco_final_crlf': b'a,b\r\n1,2\r\n3,4\r\n\r\n',
+    'linea_en_blanco_intermedia': b'a,b\n1,2\n\n3,4\n',
+    'linea_solo_espacios': b'a,b\n1,2\n  \n3,4\n',
+    'fila_de_comas': b'a,b\n1,2\n,\n3,4\n',
+    'numeros_con_espacios': b'a,b\n 3,x\n2 ,y\n',
+    'texto_con_espacios': b'a,b\n x,1\ny ,2\n',
+    'encabezado_vacio': b'a,,c\n1,2,3\n',
+    'columna_vacia': b'a,b\n1,\n2,\n',
+    'encabezado_duplicado': b'a,a,b,a\n1,2,3,4\n',
+    'entero_fuera_de_int64': b'a,b\n99999999999999999999,1\n2,2\n',
+}
+
+
+@pytest.mark.parametrize('contenido', CASOS.values(), ids=CASOS.keys())
+def test_leer_csv_coincide_con_pandas(contenido):
+    esperado = pd.read_csv(io.BytesIO(contenido))
+    pd.testing.assert_frame_equal(leer_csv(io.BytesIO(contenido)), esperado)